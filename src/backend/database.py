@@ -2,6 +2,9 @@
 MongoDB database configuration and setup for Mergington High School API
 """
 
+import json
+from pathlib import Path
+
 from pymongo import MongoClient
 from argon2 import PasswordHasher
 
@@ -11,179 +14,42 @@ db = client['mergington_high']
 activities_collection = db['activities']
 teachers_collection = db['teachers']
 
+# Sample data used to seed an empty database
+seed_dir = Path(__file__).parent / "seed"
+
+# Shared Argon2 hasher (stateless, safe to reuse)
+password_hasher = PasswordHasher()
+
 # Methods
 def hash_password(password):
     """Hash password using Argon2"""
-    ph = PasswordHasher()
-    return ph.hash(password)
+    return password_hasher.hash(password)
+
+def load_seed(filename):
+    """Load sample data from the seed directory"""
+    with open(seed_dir / filename, encoding="utf-8") as f:
+        return json.load(f)
 
 def init_database():
     """Initialize database if empty"""
 
+    # Index the day filter used by the activities listing
+    activities_collection.create_index("schedule_details.days")
+
     # Initialize activities if empty
-    if activities_collection.count_documents({}) == 0:
-        for name, details in initial_activities.items():
-            activities_collection.insert_one({"_id": name, **details})
+    if activities_collection.find_one({}, {"_id": 1}) is None:
+        initial_activities = load_seed("activities.json")
+        activities = [{"_id": name, **details} for name, details in initial_activities.items()]
+        # insert_many rejects an empty list
+        if activities:
+            activities_collection.insert_many(activities)
             
     # Initialize teacher accounts if empty
-    if teachers_collection.count_documents({}) == 0:
-        for teacher in initial_teachers:
-            teachers_collection.insert_one({"_id": teacher["username"], **teacher})
-
-# Initial database if empty
-initial_activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Mondays and Fridays, 3:15 PM - 4:45 PM",
-        "schedule_details": {
-            "days": ["Monday", "Friday"],
-            "start_time": "15:15",
-            "end_time": "16:45"
-        },
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 7:00 AM - 8:00 AM",
-        "schedule_details": {
-            "days": ["Tuesday", "Thursday"],
-            "start_time": "07:00",
-            "end_time": "08:00"
-        },
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Morning Fitness": {
-        "description": "Early morning physical training and exercises",
-        "schedule": "Mondays, Wednesdays, Fridays, 6:30 AM - 7:45 AM",
-        "schedule_details": {
-            "days": ["Monday", "Wednesday", "Friday"],
-            "start_time": "06:30",
-            "end_time": "07:45"
-        },
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    "Soccer Team": {
-        "description": "Join the school soccer team and compete in matches",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:30 PM",
-        "schedule_details": {
-            "days": ["Tuesday", "Thursday"],
-            "start_time": "15:30",
-            "end_time": "17:30"
-        },
-        "max_participants": 22,
-        "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-    },
-    "Basketball Team": {
-        "description": "Practice and compete in basketball tournaments",
-        "schedule": "Wednesdays and Fridays, 3:15 PM - 5:00 PM",
-        "schedule_details": {
-            "days": ["Wednesday", "Friday"],
-            "start_time": "15:15",
-            "end_time": "17:00"
-        },
-        "max_participants": 15,
-        "participants": ["ava@mergington.edu", "mia@mergington.edu"]
-    },
-    "Art Club": {
-        "description": "Explore various art techniques and create masterpieces",
-        "schedule": "Thursdays, 3:15 PM - 5:00 PM",
-        "schedule_details": {
-            "days": ["Thursday"],
-            "start_time": "15:15",
-            "end_time": "17:00"
-        },
-        "max_participants": 15,
-        "participants": ["amelia@mergington.edu", "harper@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Act, direct, and produce plays and performances",
-        "schedule": "Mondays and Wednesdays, 3:30 PM - 5:30 PM",
-        "schedule_details": {
-            "days": ["Monday", "Wednesday"],
-            "start_time": "15:30",
-            "end_time": "17:30"
-        },
-        "max_participants": 20,
-        "participants": ["ella@mergington.edu", "scarlett@mergington.edu"]
-    },
-    "Math Club": {
-        "description": "Solve challenging problems and prepare for math competitions",
-        "schedule": "Tuesdays, 7:15 AM - 8:00 AM",
-        "schedule_details": {
-            "days": ["Tuesday"],
-            "start_time": "07:15",
-            "end_time": "08:00"
-        },
-        "max_participants": 10,
-        "participants": ["james@mergington.edu", "benjamin@mergington.edu"]
-    },
-    "Debate Team": {
-        "description": "Develop public speaking and argumentation skills",
-        "schedule": "Fridays, 3:30 PM - 5:30 PM",
-        "schedule_details": {
-            "days": ["Friday"],
-            "start_time": "15:30",
-            "end_time": "17:30"
-        },
-        "max_participants": 12,
-        "participants": ["charlotte@mergington.edu", "amelia@mergington.edu"]
-    },
-    "Weekend Robotics Workshop": {
-        "description": "Build and program robots in our state-of-the-art workshop",
-        "schedule": "Saturdays, 10:00 AM - 2:00 PM",
-        "schedule_details": {
-            "days": ["Saturday"],
-            "start_time": "10:00",
-            "end_time": "14:00"
-        },
-        "max_participants": 15,
-        "participants": ["ethan@mergington.edu", "oliver@mergington.edu"]
-    },
-    "Science Olympiad": {
-        "description": "Weekend science competition preparation for regional and state events",
-        "schedule": "Saturdays, 1:00 PM - 4:00 PM",
-        "schedule_details": {
-            "days": ["Saturday"],
-            "start_time": "13:00",
-            "end_time": "16:00"
-        },
-        "max_participants": 18,
-        "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
-    },
-    "Sunday Chess Tournament": {
-        "description": "Weekly tournament for serious chess players with rankings",
-        "schedule": "Sundays, 2:00 PM - 5:00 PM",
-        "schedule_details": {
-            "days": ["Sunday"],
-            "start_time": "14:00",
-            "end_time": "17:00"
-        },
-        "max_participants": 16,
-        "participants": ["william@mergington.edu", "jacob@mergington.edu"]
-    }
-}
-
-initial_teachers = [
-    {
-        "username": "mrodriguez",
-        "display_name": "Ms. Rodriguez",
-        "password": hash_password("art123"),
-        "role": "teacher"
-     },
-    {
-        "username": "mchen",
-        "display_name": "Mr. Chen",
-        "password": hash_password("chess456"),
-        "role": "teacher"
-    },
-    {
-        "username": "principal",
-        "display_name": "Principal Martinez",
-        "password": hash_password("admin789"),
-        "role": "admin"
-    }
-]
-
+    if teachers_collection.find_one({}, {"_id": 1}) is None:
+        teachers = []
+        for teacher in load_seed("teachers.json"):
+            # Hash only when seeding, so importing this module stays cheap
+            teacher["password"] = hash_password(teacher.pop("password_plain"))
+            teachers.append({"_id": teacher["username"], **teacher})
+        if teachers:
+            teachers_collection.insert_many(teachers)
@@ -31,7 +31,7 @@ def get_activities(
     query = {}
     
     if day:
-        query["schedule_details.days"] = {"$in": [day]}
+        query["schedule_details.days"] = day  # Matches any element of the days array
     
     if start_time:
         query["schedule_details.start_time"] = {"$gte": start_time}
@@ -50,18 +50,8 @@ def get_activities(
 @router.get("/days", response_model=List[str])
 def get_available_days() -> List[str]:
     """Get a list of all days that have activities scheduled"""
-    # Aggregate to get unique days across all activities
-    pipeline = [
-        {"$unwind": "$schedule_details.days"},
-        {"$group": {"_id": "$schedule_details.days"}},
-        {"$sort": {"_id": 1}}  # Sort days alphabetically
-    ]
-    
-    days = []
-    for day_doc in activities_collection.aggregate(pipeline):
-        days.append(day_doc["_id"])
-    
-    return days
+    # Unique days across all activities, sorted alphabetically
+    return sorted(activities_collection.distinct("schedule_details.days"))
 
 @router.post("/{activity_name}/signup")
 def signup_for_activity(activity_name: str, email: str, teacher_username: Optional[str] = Query(None)):
@@ -70,26 +60,23 @@ def signup_for_activity(activity_name: str, email: str, teacher_username: Option
     if not teacher_username:
         raise HTTPException(status_code=401, detail="Authentication required for this action")
     
-    teacher = teachers_collection.find_one({"_id": teacher_username})
+    teacher = teachers_collection.find_one({"_id": teacher_username}, {"_id": 1})
     if not teacher:
         raise HTTPException(status_code=401, detail="Invalid teacher credentials")
     
-    # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
-    if not activity:
-        raise HTTPException(status_code=404, detail="Activity not found")
-
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(
-            status_code=400, detail="Already signed up for this activity")
-
-    # Add student to participants
+    # Add student to participants only if not already signed up
     result = activities_collection.update_one(
-        {"_id": activity_name},
+        {"_id": activity_name, "participants": {"$ne": email}},
         {"$push": {"participants": email}}
     )
 
+    if result.matched_count == 0:
+        # Either the activity does not exist or the student is already signed up
+        if not activities_collection.find_one({"_id": activity_name}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(
+            status_code=400, detail="Already signed up for this activity")
+
     if result.modified_count == 0:
         raise HTTPException(status_code=500, detail="Failed to update activity")
     
@@ -102,26 +89,23 @@ def unregister_from_activity(activity_name: str, email: str, teacher_username: O
     if not teacher_username:
         raise HTTPException(status_code=401, detail="Authentication required for this action")
     
-    teacher = teachers_collection.find_one({"_id": teacher_username})
+    teacher = teachers_collection.find_one({"_id": teacher_username}, {"_id": 1})
     if not teacher:
         raise HTTPException(status_code=401, detail="Invalid teacher credentials")
     
-    # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
-    if not activity:
-        raise HTTPException(status_code=404, detail="Activity not found")
-
-    # Validate student is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(
-            status_code=400, detail="Not registered for this activity")
-
-    # Remove student from participants
+    # Remove student from participants only if signed up
     result = activities_collection.update_one(
-        {"_id": activity_name},
+        {"_id": activity_name, "participants": email},
         {"$pull": {"participants": email}}
     )
 
+    if result.matched_count == 0:
+        # Either the activity does not exist or the student is not signed up
+        if not activities_collection.find_one({"_id": activity_name}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(
+            status_code=400, detail="Not registered for this activity")
+
     if result.modified_count == 0:
         raise HTTPException(status_code=500, detail="Failed to update activity")
     